@@ -0,0 +1,187 @@
+"""Known-plaintext (crib) verification of candidate enigma keys."""
+
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Optional
+
+from .. import core
+from ..machine._machine import EnigmaMachine
+from . import fitness
+
+
+def crib_positions(crib: str, ciphertext: str) -> Iterator[int]:
+    """Yield each offset at which the crib could lie within the ciphertext.
+
+    The enigma machine never enciphers a letter to itself, so any offset at
+    which a crib letter matches the ciphertext letter beneath it is impossible,
+    whatever the key. Characters other than letters are discarded, so offsets
+    count letters only.
+
+    Parameters
+    ----------
+    crib : str
+        The suspected plaintext
+    ciphertext : str
+        The intercepted text
+
+    Returns
+    -------
+    Iterator[int]
+        Offsets into the ciphertext consistent with the crib
+
+    Raises
+    ------
+    ValueError
+        If the crib contains no letters or is longer than the ciphertext
+    """
+    crib_codes, cipher_codes = _encode(crib, ciphertext)
+    return (
+        offset
+        for offset in range(len(cipher_codes) - len(crib_codes) + 1)
+        if not any(map(int.__eq__, crib_codes, cipher_codes[offset:]))
+    )
+
+
+def _encode(crib: str, ciphertext: str) -> tuple[bytes, bytes]:
+    crib_codes = fitness.encode(crib)
+    cipher_codes = fitness.encode(ciphertext)
+    if not crib_codes:
+        raise ValueError("crib must contain at least one letter")
+    if len(crib_codes) > len(cipher_codes):
+        raise ValueError("crib must not be longer than the ciphertext")
+    return crib_codes, cipher_codes
+
+
+def _encode_crib(crib: str, ciphertext: str, offset: int) -> tuple[bytes, bytes]:
+    crib_codes, cipher_codes = _encode(crib, ciphertext)
+    if not 0 <= offset <= len(cipher_codes) - len(crib_codes):
+        raise ValueError("offset must place the crib within the ciphertext")
+    return crib_codes, cipher_codes[offset : offset + len(crib_codes)]
+
+
+def _is_impossible(crib_codes: bytes, cipher_codes: bytes) -> bool:
+    # A letter enciphered to itself rules out every key, so reject them all
+    # before building a machine.
+    return any(map(int.__eq__, crib_codes, cipher_codes))
+
+
+def _matches_crib(
+    machine: EnigmaMachine, crib_codes: bytes, cipher_codes: bytes, offset: int
+) -> bool:
+    for _ in range(offset):
+        machine.rotate()
+
+    # all() stops at the first letter which contradicts the crib.
+    return all(
+        machine._encrypt(plain) == cipher  # noqa protected-access
+        for plain, cipher in zip(crib_codes, cipher_codes)
+    )
+
+
+def _verify_keys(
+    keys: Iterable[core.EnigmaKey], crib_codes: bytes, cipher_codes: bytes, offset: int
+) -> Iterator[core.EnigmaKey]:
+    machines: dict[tuple[core.NamedRotor, ...], EnigmaMachine] = {}
+    for key in keys:
+        rotors = tuple(key.rotors)
+        if (machine := machines.get(rotors)) is None:
+            machine = machines[rotors] = EnigmaMachine.from_key(key)
+        else:
+            machine.reset(key)
+
+        if _matches_crib(machine, crib_codes, cipher_codes, offset):
+            yield key
+
+
+def verify_indicators(
+    crib: str,
+    ciphertext: str,
+    key: core.EnigmaKey,
+    indicators: Optional[Iterable[Sequence[int]]] = None,
+    offset: int = 0,
+) -> Iterator[Sequence[int]]:
+    """Find the indicator settings which encipher the crib to the ciphertext.
+
+    One machine is built for the key's rotor order, ring settings and plugboard
+    and its rotors are reset for each setting, so testing a setting costs only
+    the letters enciphered until the first contradiction.
+
+    Parameters
+    ----------
+    crib : str
+        The suspected plaintext, characters other than letters are discarded
+    ciphertext : str
+        The intercepted text, characters other than letters are discarded
+    key : core.EnigmaKey
+        The key to test, its indicators are ignored
+    indicators : Iterable[Sequence[int]], optional
+        The indicator settings to test, consumed lazily, by default every
+        possible setting
+    offset : int, optional
+        The position of the crib within the ciphertext, by default 0
+
+    Returns
+    -------
+    Iterator[Sequence[int]]
+        The indicator settings consistent with the crib
+
+    Raises
+    ------
+    ValueError
+        If the crib contains no letters or the offset does not place it within
+        the ciphertext
+    """
+    crib_codes, cipher_codes = _encode_crib(crib, ciphertext, offset)
+    if _is_impossible(crib_codes, cipher_codes):
+        return iter(())
+
+    machine = EnigmaMachine.from_key(key)
+    if indicators is None:
+        indicators = itertools.product(range(26), repeat=len(key.rotors))
+
+    def matches(setting: Sequence[int]) -> bool:
+        machine.set_indicators(list(setting))
+        return _matches_crib(machine, crib_codes, cipher_codes, offset)
+
+    return filter(matches, indicators)
+
+
+def verify_crib(
+    crib: str,
+    ciphertext: str,
+    keys: Iterable[core.EnigmaKey],
+    offset: int = 0,
+) -> Iterator[core.EnigmaKey]:
+    """Find the candidate keys which encipher the crib to the ciphertext.
+
+    Each candidate is stepped a letter at a time and abandoned at the first
+    letter which contradicts the crib. One machine is built for each rotor
+    order and reset for every key using it, so the keys may come in any order.
+
+    Parameters
+    ----------
+    crib : str
+        The suspected plaintext, characters other than letters are discarded
+    ciphertext : str
+        The intercepted text, characters other than letters are discarded
+    keys : Iterable[core.EnigmaKey]
+        The candidate keys to test, consumed lazily
+    offset : int, optional
+        The position of the crib within the ciphertext, by default 0
+
+    Returns
+    -------
+    Iterator[core.EnigmaKey]
+        The keys consistent with the crib
+
+    Raises
+    ------
+    ValueError
+        If the crib contains no letters or the offset does not place it within
+        the ciphertext
+    """
+    crib_codes, cipher_codes = _encode_crib(crib, ciphertext, offset)
+    if _is_impossible(crib_codes, cipher_codes):
+        return iter(())
+    return _verify_keys(keys, crib_codes, cipher_codes, offset)
+
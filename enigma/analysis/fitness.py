@@ -1,6 +1,9 @@
 """Implements fitness functions used in cryptoanalysis."""
 
 import collections
+import operator
+
+from .. import core
 
 
 def index_of_coincidence(
@@ -32,3 +35,66 @@ def index_of_coincidence(
     numerator = sum(count * (count - 1) for count in character_counts.values())
 
     return numerator / denominator if denominator != 0 else 0
+
+
+def encode(text: str) -> bytes:
+    """Integer code the letters of a text, discarding any other characters.
+
+    Parameters
+    ----------
+    text : str
+        The text to encode
+
+    Returns
+    -------
+    bytes
+        One byte per letter, with A as 0 through to Z as 25
+    """
+    return bytes(
+        core.character_to_int(char) for char in text.upper() if "A" <= char <= "Z"
+    )
+
+
+def coincidence_rate(
+    first: bytes,
+    second: bytes,
+    offset: int = 0,
+    normalizing_coeficient: int = 26,
+    normalize: bool = True,
+) -> float:
+    """The proportion of aligned positions at which two texts share a letter.
+
+    This is the pairwise form of the index of coincidence. Two texts enciphered
+    with the same key, i.e. in depth, coincide at roughly the rate of the
+    plaintext language, whereas unrelated ciphertexts coincide at random.
+
+    Parameters
+    ----------
+    first : bytes
+        An integer coded text, see encode
+    second : bytes
+        An integer coded text, see encode
+    offset : int, optional
+        How far the second text is shifted along the first, by default 0
+    normalizing_coeficient : int, optional
+        The normalizing coefficient, usually the number of unique characters
+        in the language's alphabet, by default 26. Ignored if normalize is false
+    normalize : bool, optional
+        Whether to normalize the output , by default True
+
+    Returns
+    -------
+    float
+    """
+    if not normalize:
+        normalizing_coeficient = 1
+
+    if offset >= 0:
+        first = first[offset:]
+    else:
+        second = second[-offset:]
+
+    overlap = min(len(first), len(second))
+    coincidences = sum(map(operator.eq, first, second))
+
+    return coincidences * normalizing_coeficient / overlap if overlap != 0 else 0
@@ -29,17 +29,31 @@ class EnigmaMachine:
 
         return cls(rotors, reflector.Reflector.create("B"), plugboard_)
 
-    def rotate(self) -> None:
-        def rotate_rotors(rotors: list[rotor.Rotor]) -> list[rotor.Rotor]:
-            rightmost_rotor = rotors[-1]
+    def set_indicators(self, indicators: list[int]) -> None:
+        for rotor_, indicator in zip(self.rotors, indicators):
+            rotor_.rotor_position = indicator
+
+    def set_rings(self, rings: list[int]) -> None:
+        for rotor_, ring_setting in zip(self.rotors, rings):
+            rotor_.ring_setting = ring_setting
 
-            if rightmost_rotor.is_at_notch and len(rotors) != 1:
-                rotors[:-1] = rotate_rotors(rotors[:-1])
+    def reset(self, key: core.EnigmaKey) -> None:
+        """Set the machine to a key using the same rotors, without rebuilding them"""
+        if [rotor_.name for rotor_ in self.rotors] != list(map(str, key.rotors)):
+            raise ValueError("key must use the same rotors as the machine")
 
-            rightmost_rotor.turnover()
-            return rotors
+        self.set_indicators(key.indicators)
+        self.set_rings(key.rings)
+        self.plugboard = plugboard.Plugboard(key.plugboard)
+
+    def rotate(self) -> None:
+        # Each rotor resting at its notch also turns the rotor to its left.
+        leftmost_turned = len(self.rotors) - 1
+        while leftmost_turned > 0 and self.rotors[leftmost_turned].is_at_notch:
+            leftmost_turned -= 1
 
-        self.rotors = rotate_rotors(self.rotors)
+        for rotor_ in self.rotors[leftmost_turned:]:
+            rotor_.turnover()
 
     @overload
     def _encrypt(self, character: int) -> int:
@@ -51,6 +65,7 @@ class EnigmaMachine:
 
     def _encrypt(self, character: core.Encypherable) -> core.Encypherable:
         self.rotate()
+        character = self.plugboard.forward(character)
 
         for rotor_ in self.rotors:
             character = rotor_.forward(character)
@@ -60,7 +75,10 @@ class EnigmaMachine:
         for rotor_ in reversed(self.rotors):
             character = rotor_.backward(character)
 
-        return character
+        return self.plugboard.forward(character)
 
     def encrypt(self, message: str) -> str:
-        return "".join((self._encrypt(char) for char in message))
+        return "".join(
+            core.int_to_char(self._encrypt(core.character_to_int(char)))
+            for char in message
+        )
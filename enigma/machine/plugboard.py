@@ -1,3 +1,4 @@
+import re
 from typing import overload
 
 from enigma import core
@@ -7,9 +8,10 @@ from enigma.machine.wiring import Wiring
 class Plugboard:
     def __init__(self, connections: str) -> None:
         self.wiring = self._decode_plugboard(connections)
+        self._table = list(self.wiring)
 
     def _forward_int(self, char: int) -> int:
-        return self.wiring[char]
+        return self._table[char]
 
     @overload
     def forward(self, char: int) -> int:
@@ -36,7 +38,7 @@ class Plugboard:
         if connections == "":
             return self._identity_plugboard()  # noqa protected-access
 
-        pairings = connections.split("[^a-zA-Z]")
+        pairings = re.split("[^A-Z]+", connections.upper().strip())
         plugged_characters: set[int] = set()
 
         mapping = self._identity_plugboard()
@@ -46,7 +48,7 @@ class Plugboard:
                 return self._identity_plugboard()
 
             char1 = core.character_to_int(pair[0])
-            char2 = core.character_to_int(pair[2])
+            char2 = core.character_to_int(pair[1])
 
             if char1 in plugged_characters or char2 in plugged_characters:
                 return self._identity_plugboard()
@@ -11,9 +11,10 @@ from . import wiring
 class Reflector:
     def __init__(self, encoding: str):
         self.wiring = wiring.Wiring(encoding)
+        self._table = list(self.wiring)
 
     def _forward_int(self, value: int) -> int:
-        return self.wiring[value]
+        return self._table[value]
 
     @overload
     def forward(self, value: str) -> str:
@@ -77,6 +77,9 @@ class BasicRotor(Rotor):
     ) -> None:
         self.name = name
         self.wiring = wiring.Wiring(encoding)
+        self._backward_wiring = self.wiring.inverse()
+        self._forward_table = list(self.wiring)
+        self._backward_table = list(self._backward_wiring)
         self.rotor_position = rotor_position
         self.notch_position = notch_position
         self.ring_setting = ring_setting
@@ -97,7 +100,7 @@ class BasicRotor(Rotor):
 
     @property
     def backward_wiring(self) -> wiring.Wiring:
-        return self.wiring.inverse()
+        return self._backward_wiring
 
     @property
     def is_at_notch(self) -> bool:
@@ -120,11 +123,11 @@ class BasicRotor(Rotor):
         ...
 
     def forward(self, value: core.Encypherable) -> core.Encypherable:
-        if isinstance(value, str) and len(value) == 1:
-            return self._encipher_char(value, self.forward_wiring)
-
         if isinstance(value, int):
-            return self._encipher(value, self.forward_wiring)
+            return self._encipher(value, self._forward_table)
+
+        if isinstance(value, str) and len(value) == 1:
+            return self._encipher_char(value, self._forward_table)
         raise NotImplementedError
 
     @overload
@@ -136,11 +139,11 @@ class BasicRotor(Rotor):
         ...
 
     def backward(self, value: core.Encypherable) -> core.Encypherable:
-        if isinstance(value, str) and len(value) == 1:
-            return self._encipher_char(value, self.backward_wiring)
-
         if isinstance(value, int):
-            return self._encipher(value, self.backward_wiring)
+            return self._encipher(value, self._backward_table)
+
+        if isinstance(value, str) and len(value) == 1:
+            return self._encipher_char(value, self._backward_table)
         raise NotImplementedError
 
 
@@ -161,29 +164,29 @@ class TwoNotchRotor(BasicRotor):
         return self.rotor_position in [12, 25]
 
 
+@dataclass(frozen=True)
+class _RotorInput:
+    encoding: str
+    notch_position: int
+    rotor_type: Type[Rotor]
+
+
+_NAMED_ROTOR_INPUTS = {
+    core.NamedRotor.I: _RotorInput("EKMFLGDQVZNTOWYHXUSPAIBRCJ", 16, BasicRotor),
+    core.NamedRotor.II: _RotorInput("AJDKSIRUXBLHWTMCQGZNPYFVOE", 4, BasicRotor),
+    core.NamedRotor.III: _RotorInput("BDFHJLCPRTXVZNYEIWGAKMUSQO", 21, BasicRotor),
+    core.NamedRotor.IV: _RotorInput("ESOVPZJAYQUIRHXLNFTGKDCMWB", 9, BasicRotor),
+    core.NamedRotor.V: _RotorInput("VZBRGITYUPSDNHLXAWMJQOFECK", 25, BasicRotor),
+    core.NamedRotor.VI: _RotorInput("JPGVOUMFYQBENHZRDKASXLICTW", 0, TwoNotchRotor),
+    core.NamedRotor.VII: _RotorInput("NZJHGRCXMYSWBOUFAIVLPEKQDT", 0, TwoNotchRotor),
+    core.NamedRotor.VIII: _RotorInput("FKQHTLXOCBJSPDZRAMEWNIUYGV", 0, TwoNotchRotor),
+}
+
+
 def create_rotor(
     name: core.NamedRotor, rotor_position: int, ring_setting: int
 ) -> Rotor:
-    @dataclass(frozen=True)
-    class RotorInput:
-        encoding: str
-        notch_position: int
-        rotor_type: Type[Rotor]
-
-    named_rotors_inputs = {
-        core.NamedRotor.I: RotorInput("EKMFLGDQVZNTOWYHXUSPAIBRCJ", 16, BasicRotor),
-        core.NamedRotor.II: RotorInput("AJDKSIRUXBLHWTMCQGZNPYFVOE", 4, BasicRotor),
-        core.NamedRotor.III: RotorInput("BDFHJLCPRTXVZNYEIWGAKMUSQO", 21, BasicRotor),
-        core.NamedRotor.IV: RotorInput("ESOVPZJAYQUIRHXLNFTGKDCMWB", 9, BasicRotor),
-        core.NamedRotor.V: RotorInput("VZBRGITYUPSDNHLXAWMJQOFECK", 25, BasicRotor),
-        core.NamedRotor.VI: RotorInput("JPGVOUMFYQBENHZRDKASXLICTW", 0, TwoNotchRotor),
-        core.NamedRotor.VII: RotorInput("NZJHGRCXMYSWBOUFAIVLPEKQDT", 0, TwoNotchRotor),
-        core.NamedRotor.VIII: RotorInput(
-            "FKQHTLXOCBJSPDZRAMEWNIUYGV", 0, TwoNotchRotor
-        ),
-    }
-
-    inputs = named_rotors_inputs[name]
+    inputs = _NAMED_ROTOR_INPUTS[name]
     return inputs.rotor_type(
         str(name), inputs.encoding, rotor_position, ring_setting, inputs.notch_position
     )
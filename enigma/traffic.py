@@ -0,0 +1,207 @@
+"""Generates synthetic enigma traffic for load and throughput testing"""
+
+from __future__ import annotations
+
+import collections
+import random
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Protocol, TextIO
+
+from . import core
+from .machine._machine import EnigmaMachine
+
+_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class PlaintextSource(Protocol):
+    def __call__(self, rng: random.Random, length: int) -> str:
+        ...
+
+
+class NgramModel:
+    """A character level n-gram model of a language, trained on a corpus.
+
+    Parameters
+    ----------
+    corpus : str
+        Text in the language to model, characters other than letters are
+        discarded
+    order : int, optional
+        The number of letters in each n-gram, by default 3
+    """
+
+    def __init__(self, corpus: str, order: int = 3) -> None:
+        if order < 1:
+            raise ValueError("order must be at least 1")
+
+        text = "".join(char for char in corpus.upper() if char in _ALPHABET)
+        if len(text) < order:
+            raise ValueError(f"corpus must contain at least {order} letters")
+
+        self.order = order
+        counts: dict[str, collections.Counter[str]] = collections.defaultdict(
+            collections.Counter
+        )
+        for idx in range(len(text) - order + 1):
+            counts[text[idx : idx + order - 1]][text[idx + order - 1]] += 1
+
+        self._contexts = list(counts)
+        self._transitions = {
+            context: (list(following), _cumulative(following.values()))
+            for context, following in counts.items()
+        }
+
+    def __call__(self, rng: random.Random, length: int) -> str:
+        return self.generate(rng, length)
+
+    def generate(self, rng: random.Random, length: int) -> str:
+        """Sample a text from the model.
+
+        Parameters
+        ----------
+        rng : random.Random
+            The source of randomness, seed it for reproducible text
+        length : int
+            The number of letters to generate
+
+        Returns
+        -------
+        str
+        """
+        letters = list(rng.choice(self._contexts))
+        while len(letters) < length:
+            context = "".join(letters[len(letters) - self.order + 1 :])
+            if (transition := self._transitions.get(context)) is None:
+                letters.extend(rng.choice(self._contexts))
+                continue
+            following, cum_weights = transition
+            letters.append(rng.choices(following, cum_weights=cum_weights)[0])
+        return "".join(letters[:length])
+
+
+def _cumulative(weights: Iterable[int]) -> list[int]:
+    total = 0
+    cumulative = []
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+    return cumulative
+
+
+@dataclass(frozen=True)
+class TrafficMessage:
+    key: core.EnigmaKey
+    plaintext: str
+    ciphertext: str
+
+
+def random_key(rng: random.Random, plugboard_pairs: int = 10) -> core.EnigmaKey:
+    """Create a random, valid enigma key.
+
+    Parameters
+    ----------
+    rng : random.Random
+        The source of randomness, seed it for reproducible keys
+    plugboard_pairs : int, optional
+        The number of plugboard connections, by default 10
+
+    Returns
+    -------
+    core.EnigmaKey
+    """
+    if not 0 <= plugboard_pairs <= 13:
+        raise ValueError("plugboard_pairs must be between 0 and 13")
+
+    plugged = rng.sample(_ALPHABET, 2 * plugboard_pairs)
+    return core.EnigmaKey(
+        rotors=rng.sample(list(core.NamedRotor), 3),
+        indicators=[rng.randrange(26) for _ in range(3)],
+        rings=[rng.randrange(26) for _ in range(3)],
+        plugboard=" ".join(
+            plugged[idx] + plugged[idx + 1] for idx in range(0, len(plugged), 2)
+        ),
+    )
+
+
+def generate_traffic(
+    source: PlaintextSource,
+    seed: int,
+    message_length: int = 250,
+    plugboard_pairs: int = 10,
+) -> Iterator[TrafficMessage]:
+    """Endlessly yield messages enciphered with random keys.
+
+    The same seed and source always produce the same traffic. Use
+    itertools.islice to take a fixed number of messages. One machine is built
+    for each rotor order and reset for every key using it.
+
+    Parameters
+    ----------
+    source : PlaintextSource
+        Called with the random number generator and the message length to
+        produce each plaintext, e.g. an NgramModel
+    seed : int
+        Seeds the keys and the plaintexts
+    message_length : int, optional
+        The number of letters in each message, by default 250
+    plugboard_pairs : int, optional
+        The number of plugboard connections in each key, by default 10
+
+    Yields
+    ------
+    TrafficMessage
+    """
+    rng = random.Random(seed)
+    machines: dict[tuple[core.NamedRotor, ...], EnigmaMachine] = {}
+    while True:
+        key = random_key(rng, plugboard_pairs)
+        plaintext = source(rng, message_length)
+
+        rotors = tuple(key.rotors)
+        if (machine := machines.get(rotors)) is None:
+            machine = machines[rotors] = EnigmaMachine.from_key(key)
+        else:
+            machine.reset(key)
+
+        yield TrafficMessage(key, plaintext, machine.encrypt(plaintext))
+
+
+def format_message(message: TrafficMessage) -> str:
+    """Format a message as a tab separated line.
+
+    The fields are the rotor order, the indicators, the ring settings, the
+    plugboard, the plaintext and the ciphertext.
+
+    Parameters
+    ----------
+    message : TrafficMessage
+
+    Returns
+    -------
+    str
+    """
+    key = message.key
+    return "\t".join(
+        (
+            " ".join(rotor.name for rotor in key.rotors),
+            "".join(map(core.int_to_char, key.indicators)),
+            "".join(map(core.int_to_char, key.rings)),
+            key.plugboard,
+            message.plaintext,
+            message.ciphertext,
+        )
+    )
+
+
+def write_traffic(messages: Iterable[TrafficMessage], stream: TextIO) -> None:
+    """Stream messages to a file or pipe, one per line, see format_message.
+
+    Parameters
+    ----------
+    messages : Iterable[TrafficMessage]
+        The messages to write, consumed lazily
+    stream : TextIO
+        The file or pipe to write to
+    """
+    stream.writelines(f"{format_message(message)}\n" for message in messages)
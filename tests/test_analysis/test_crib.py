@@ -0,0 +1,158 @@
+"""Tests for the crib verification functions in the analysis module"""
+
+import itertools
+import random
+
+import pytest
+
+from enigma import core, traffic
+from enigma.analysis import crib
+from enigma.machine._machine import EnigmaMachine
+
+
+def _encrypt(key: core.EnigmaKey, message: str) -> str:
+    return EnigmaMachine.from_key(key).encrypt(message)
+
+
+def _candidate_keys() -> list[core.EnigmaKey]:
+    return [
+        core.EnigmaKey(indicators=list(indicators))
+        for indicators in itertools.product(range(3), repeat=3)
+    ]
+
+
+def test_crib_positions_excludes_self_enciphering_offsets() -> None:
+    """
+    GIVEN a crib and a ciphertext
+
+    THEN only offsets where no letter enciphers to itself are yielded
+    """
+    assert list(crib.crib_positions("AB", "XAYC")) == [0, 2]
+
+
+@pytest.mark.parametrize(("crib_text", "ciphertext"), [("ABCDE", "XYZ"), (" .", "XYZ")])
+def test_crib_positions_rejects_a_crib_that_does_not_fit(crib_text, ciphertext) -> None:
+    with pytest.raises(ValueError):
+        crib.crib_positions(crib_text, ciphertext)
+
+
+def test_verify_crib_yields_only_the_true_key() -> None:
+    """
+    GIVEN a ciphertext enciphered with a known key
+
+    WHEN verify_crib is called with a crib and several candidate keys
+    THEN only the true key is yielded
+    """
+    true_key = core.EnigmaKey(indicators=[1, 2, 0])
+    ciphertext = _encrypt(true_key, "WETTERVORHERSAGE")
+
+    survivors = list(crib.verify_crib("WETTER", ciphertext, _candidate_keys()))
+
+    assert survivors == [true_key]
+
+
+@pytest.mark.parametrize("offset", [0, 3, 7])
+def test_verify_crib_at_offset(offset) -> None:
+    """
+    GIVEN a crib located part way through the ciphertext
+
+    THEN the true key is found when the offset is supplied
+    """
+    true_key = core.EnigmaKey(indicators=[2, 0, 1])
+    plaintext = "ANXOBERKOMMANDOXDERWEHRMACHT"
+    ciphertext = _encrypt(true_key, plaintext)
+    crib_text = plaintext[offset : offset + 8]
+
+    survivors = list(
+        crib.verify_crib(crib_text, ciphertext, _candidate_keys(), offset=offset)
+    )
+
+    assert true_key in survivors
+
+
+def test_verify_crib_rejects_self_encipherment_without_consuming_keys() -> None:
+    """
+    GIVEN a crib with a letter matching the ciphertext beneath it
+
+    THEN no keys are yielded
+    AND the candidate keys are never consumed
+    """
+    keys = iter(_candidate_keys())
+
+    assert not list(crib.verify_crib("AB", "AX", keys))
+    assert len(list(keys)) == 27
+
+
+def test_verify_crib_ignores_non_letters() -> None:
+    """
+    GIVEN a crib and ciphertext containing spaces and punctuation
+
+    THEN only the letters are compared
+    """
+    true_key = core.EnigmaKey(indicators=[1, 2, 0])
+    ciphertext = _encrypt(true_key, "WETTERVORHERSAGE")
+    spaced = " ".join(ciphertext[idx : idx + 5] for idx in range(0, 16, 5))
+
+    survivors = list(crib.verify_crib("WE TTER.", spaced, _candidate_keys()))
+
+    assert survivors == [true_key]
+
+
+@pytest.mark.parametrize("offset", [-1, 3])
+def test_verify_crib_rejects_an_offset_outside_the_ciphertext(offset) -> None:
+    with pytest.raises(ValueError):
+        crib.verify_crib("WETTER", "ABCDEFGH", _candidate_keys(), offset=offset)
+
+
+def test_verify_crib_rejects_a_crib_without_letters() -> None:
+    with pytest.raises(ValueError):
+        crib.verify_crib(" .", "ABCDEFGH", _candidate_keys())
+
+
+def test_verify_indicators_searches_every_setting() -> None:
+    """
+    GIVEN a key with unknown indicators
+
+    WHEN verify_indicators is called without a range of settings
+    THEN every setting is tested
+    AND the true setting is found
+    """
+    true_key = core.EnigmaKey(
+        rotors=[core.NamedRotor.II, core.NamedRotor.V, core.NamedRotor.I],
+        indicators=[17, 4, 22],
+        rings=[1, 2, 3],
+    )
+    ciphertext = _encrypt(true_key, "KEINEBESONDERENEREIGNISSE")
+
+    survivors = list(crib.verify_indicators("KEINEBESONDEREN", ciphertext, true_key))
+
+    assert [list(setting) for setting in survivors] == [[17, 4, 22]]
+
+
+def test_verify_indicators_within_a_range() -> None:
+    true_key = core.EnigmaKey(indicators=[2, 1, 2])
+    ciphertext = _encrypt(true_key, "ANXOBERKOMMANDO")
+    indicators = itertools.product(range(3), repeat=3)
+
+    survivors = list(
+        crib.verify_indicators("ANXOBERKOMMANDO", ciphertext, true_key, indicators)
+    )
+
+    assert survivors == [(2, 1, 2)]
+
+
+def test_verify_crib_with_mixed_rotors_rings_and_plugboards() -> None:
+    """
+    GIVEN candidate keys which differ in rotors, rings and plugboard, in any order
+
+    THEN each candidate is tested with its own settings
+    AND only the true key is yielded
+    """
+    rng = random.Random(0)
+    candidates = [traffic.random_key(rng) for _ in range(200)]
+    true_key = candidates[137]
+    ciphertext = _encrypt(true_key, "WETTERVORHERSAGEBISKAYA")
+
+    survivors = list(crib.verify_crib("WETTERVORHERSAGE", ciphertext, candidates))
+
+    assert survivors == [true_key]
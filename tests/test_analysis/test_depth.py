@@ -0,0 +1,137 @@
+"""Tests for the depth detection in the analysis module"""
+
+import random
+
+from enigma import core, traffic
+from enigma.analysis import depth, fitness
+from enigma.machine._machine import EnigmaMachine
+
+# Operators opened messages with a stereotyped preamble, so messages in depth
+# coincide heavily where their preambles align.
+PREAMBLE = "ANOBERKOMMANDODERWEHRMACHTBETREFFLAGEBERICHT"
+PLAINTEXTS = [
+    PREAMBLE + "FEINDLICHEVERBAENDEIMRAUMNOERDLICHDERSTADT",
+    PREAMBLE + "WETTERVORHERSAGEFUERMORGENREGENUNDNEBEL",
+    PREAMBLE + "NACHSCHUBEINGETROFFENMUNITIONAUSREICHEND",
+]
+
+
+def _encrypt(key: core.EnigmaKey, message: str) -> str:
+    return EnigmaMachine.from_key(key).encrypt(message)
+
+
+def test_find_depths_finds_messages_sent_with_the_same_key() -> None:
+    """
+    GIVEN messages where two share a key
+
+    THEN only that pair is reported
+    """
+    shared_key = core.EnigmaKey(indicators=[3, 7, 11])
+    messages = [
+        _encrypt(shared_key, PLAINTEXTS[0]),
+        _encrypt(core.EnigmaKey(indicators=[5, 1, 20]), PLAINTEXTS[1]),
+        _encrypt(shared_key, PLAINTEXTS[2]),
+    ]
+
+    depths = list(depth.find_depths(messages, min_overlap=40))
+
+    assert [(found.first, found.second, found.offset) for found in depths] == [
+        (0, 2, 0)
+    ]
+
+
+def test_find_depths_finds_messages_at_an_offset() -> None:
+    """
+    GIVEN two messages with the same key, one starting later in the key stream
+
+    THEN the pair is most strongly reported at the offset between them
+    """
+    key = core.EnigmaKey(indicators=[3, 7, 11])
+    machine = EnigmaMachine.from_key(key)
+    for _ in range(3):
+        machine.rotate()
+    messages = [
+        _encrypt(key, PLAINTEXTS[0]),
+        machine.encrypt(PLAINTEXTS[1][3:]),
+    ]
+
+    depths = depth.find_depths(messages, min_overlap=40, max_offset=5)
+    strongest = max(depths, key=lambda found: found.rate)
+
+    assert (strongest.first, strongest.second, strongest.offset) == (0, 1, 3)
+
+
+def test_find_depths_skips_short_messages() -> None:
+    key = core.EnigmaKey()
+    messages = [_encrypt(key, "ATTACKATDAWN"), _encrypt(key, "ATTACKATDUSK")]
+
+    assert not list(depth.find_depths(messages, min_overlap=40))
+
+
+def test_find_depths_only_compares_pairs_sharing_a_repeat(monkeypatch) -> None:
+    """
+    GIVEN a corpus of unrelated messages and one pair in depth
+
+    THEN most pairs are never compared
+    AND the pair in depth is reported
+    """
+    comparisons = []
+
+    def counting_coincidence_rate(*args, **kwargs):
+        comparisons.append(args)
+        return coincidence_rate(*args, **kwargs)
+
+    coincidence_rate = fitness.coincidence_rate
+    monkeypatch.setattr(fitness, "coincidence_rate", counting_coincidence_rate)
+
+    rng = random.Random(0)
+    messages = [
+        "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(100))
+        for _ in range(200)
+    ]
+    key = core.EnigmaKey(indicators=[3, 7, 11])
+    messages += [_encrypt(key, PLAINTEXTS[0]), _encrypt(key, PLAINTEXTS[2])]
+
+    depths = list(depth.find_depths(messages, min_overlap=40))
+
+    pairs = len(messages) * (len(messages) - 1) // 2
+    assert len(comparisons) < pairs // 4
+    found_pairs = [(found.first, found.second, found.offset) for found in depths]
+    assert (200, 201, 0) in found_pairs
+
+
+def test_find_depths_from_coincidences_alone() -> None:
+    """
+    GIVEN two long messages in depth whose plaintexts differ throughout
+    AND unrelated messages in the same language
+
+    THEN only the pair in depth is reported
+    AND it is ranked the strongest
+    """
+    model = traffic.NgramModel(
+        "DIE FEINDLICHEN VERBAENDE HABEN SICH IN DER NACHT NACH NORDEN "
+        "ZURUECKGEZOGEN DAS WETTER FUER MORGEN WIRD REGNERISCH MIT NEBEL IN DEN "
+        "TAELERN ERWARTET DER NACHSCHUB IST EINGETROFFEN UND DIE MUNITION REICHT "
+        "FUER DREI TAGE DIE STELLUNGEN AM FLUSS WERDEN GEHALTEN BIS VERSTAERKUNG "
+        "EINTRIFFT FLIEGERANGRIFF AUF DEN BAHNHOF ERWARTET ALLE EINHEITEN SIND IN "
+        "BEREITSCHAFT"
+    )
+    rng = random.Random(4)
+    first, second = model(rng, 1000), model(rng, 1000)
+    aligned = bytes(a == b for a, b in zip(first, second))
+    assert max(map(len, aligned.split(b"\x00"))) <= 2
+
+    key = core.EnigmaKey(indicators=[3, 7, 11])
+    messages = [_encrypt(key, first), _encrypt(key, second)]
+    messages += [
+        _encrypt(core.EnigmaKey(indicators=[idx, 2 * idx % 26, 5]), model(rng, 1000))
+        for idx in range(1, 9)
+    ]
+
+    depths = list(depth.find_depths(messages))
+    strongest = depth.strongest_depths(messages, count=1)
+
+    assert [(found.first, found.second, found.offset) for found in depths] == [
+        (0, 1, 0)
+    ]
+    assert (strongest[0].first, strongest[0].second) == (0, 1)
@@ -29,3 +29,42 @@ def test_index_of_coincidence_no_input() -> None:
     THEN 0 is returned
     """
     assert fitness.index_of_coincidence("") == 0
+
+
+def test_encode_discards_non_letters() -> None:
+    """
+    GIVEN a string containing spaces and punctuation
+
+    THEN only the letters are integer coded
+    """
+    assert fitness.encode("ab, Z!") == bytes([0, 1, 25])
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "offset", "expected"),
+    [
+        ("ABCD", "ABCD", 0, 26.0),
+        ("ABCD", "ABXX", 0, 13.0),
+        ("XABC", "ABCD", 1, 26.0),
+        ("ABCD", "XABC", -1, 26.0),
+        ("ABCD", "WXYZ", 0, 0.0),
+        ("", "ABCD", 0, 0),
+    ],
+)
+def test_coincidence_rate_correct_output(first, second, offset, expected) -> None:
+    """
+    GIVEN two integer coded strings
+
+    THEN the normalized proportion of aligned matching letters is returned
+    """
+    result = fitness.coincidence_rate(
+        fitness.encode(first), fitness.encode(second), offset
+    )
+    assert result == pytest.approx(expected)
+
+
+def test_coincidence_rate_unnormalized() -> None:
+    result = fitness.coincidence_rate(
+        fitness.encode("ABCD"), fitness.encode("ABXX"), normalize=False
+    )
+    assert result == pytest.approx(0.5)
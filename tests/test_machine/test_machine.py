@@ -0,0 +1,79 @@
+"""Tests for the enigma machine"""
+
+import pytest
+
+from enigma import core
+from enigma.machine._machine import EnigmaMachine
+
+PLAINTEXT = "WETTERVORHERSAGEBISKAYA"
+
+
+@pytest.fixture
+def key() -> core.EnigmaKey:
+    return core.EnigmaKey(
+        rotors=[core.NamedRotor.II, core.NamedRotor.IV, core.NamedRotor.V],
+        indicators=[1, 4, 11],
+        rings=[2, 20, 9],
+        plugboard="AV BS CG DL FU HZ IN KM OW RX",
+    )
+
+
+def test_machine_encrypts_with_a_plugboard(key) -> None:
+    """
+    GIVEN a key with a plugboard
+
+    THEN the message is encrypted to the same ciphertext as before
+
+    This is a regression snapshot of this machine's own output, not a reference
+    vector. The machine steps rotors[-1] but passes the signal through rotors[0]
+    first, so it does not reproduce a historical enigma.
+    """
+    assert EnigmaMachine.from_key(key).encrypt(PLAINTEXT) == "AAAYYNBUXUAQEKQZUJHQPVX"
+
+
+def test_machine_swaps_plugged_letters_on_the_way_in_and_out(key) -> None:
+    """
+    GIVEN a key with a plugboard
+
+    THEN encrypting is the same as swapping the plugged letters, encrypting
+    without the plugboard, then swapping the plugged letters again
+    """
+    swaps = {}
+    for pair in key.plugboard.split():
+        swaps[pair[0]], swaps[pair[1]] = pair[1], pair[0]
+
+    def swap(message: str) -> str:
+        return "".join(swaps.get(char, char) for char in message)
+
+    unplugged = core.EnigmaKey(key.rotors, key.indicators, key.rings)
+    expected = swap(EnigmaMachine.from_key(unplugged).encrypt(swap(PLAINTEXT)))
+
+    assert EnigmaMachine.from_key(key).encrypt(PLAINTEXT) == expected
+
+
+def test_machine_decrypts_its_own_ciphertext(key) -> None:
+    ciphertext = EnigmaMachine.from_key(key).encrypt(PLAINTEXT)
+    assert EnigmaMachine.from_key(key).encrypt(ciphertext) == PLAINTEXT
+
+
+def test_reset_machine_matches_a_new_machine(key) -> None:
+    """
+    GIVEN a machine which has already encrypted a message
+
+    WHEN it is reset to another key using the same rotors
+    THEN it encrypts exactly as a new machine built from that key
+    """
+    machine = EnigmaMachine.from_key(key)
+    machine.encrypt(PLAINTEXT)
+    other = core.EnigmaKey(key.rotors, [20, 0, 5], [7, 13, 1], "QE TY")
+
+    machine.reset(other)
+
+    assert machine.encrypt(PLAINTEXT) == EnigmaMachine.from_key(other).encrypt(
+        PLAINTEXT
+    )
+
+
+def test_reset_rejects_different_rotors(key) -> None:
+    with pytest.raises(ValueError):
+        EnigmaMachine.from_key(key).reset(core.EnigmaKey())
@@ -0,0 +1,46 @@
+"""Tests for the plugboard of the enigma machine"""
+
+import pytest
+
+from enigma.machine import plugboard
+
+IDENTITY = list(range(26))
+
+
+def _swapped(*pairs: tuple[int, int]) -> list[int]:
+    mapping = list(IDENTITY)
+    for first, second in pairs:
+        mapping[first], mapping[second] = second, first
+    return mapping
+
+
+def test_empty_plugboard_is_the_identity() -> None:
+    assert plugboard.Plugboard("").wiring == IDENTITY
+
+
+@pytest.mark.parametrize("connections", ["AB CD", "ab cd", "AB-CD", " AB  CD "])
+def test_plugboard_connects_each_pair(connections) -> None:
+    """
+    GIVEN plugboard connections separated by non-letters, in either case
+
+    THEN each pair of letters is swapped
+    AND every other letter is unchanged
+    """
+    assert plugboard.Plugboard(connections).wiring == _swapped((0, 1), (2, 3))
+
+
+@pytest.mark.parametrize("connections", ["ABC DE", "AB BC"])
+def test_invalid_plugboard_is_the_identity(connections) -> None:
+    """
+    GIVEN connections that are not pairs, or that plug a letter twice
+
+    THEN the plugboard leaves every letter unchanged
+    """
+    assert plugboard.Plugboard(connections).wiring == IDENTITY
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [(0, 25), (25, 0), (4, 4), ("A", "Z"), ("Z", "A")]
+)
+def test_plugboard_forward(value, expected) -> None:
+    assert plugboard.Plugboard("AZ").forward(value) == expected
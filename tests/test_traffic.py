@@ -0,0 +1,109 @@
+"""Tests for the synthetic traffic generator"""
+
+import io
+import itertools
+import random
+
+import pytest
+
+from enigma import core, traffic
+from enigma.machine._machine import EnigmaMachine
+
+CORPUS = (
+    "DIE FEINDLICHEN VERBAENDE HABEN SICH IN DER NACHT NACH NORDEN ZURUECKGEZOGEN "
+    "DAS WETTER FUER MORGEN WIRD REGNERISCH MIT NEBEL IN DEN TAELERN ERWARTET "
+    "DER NACHSCHUB IST EINGETROFFEN UND DIE MUNITION REICHT FUER DREI TAGE"
+)
+
+
+@pytest.fixture
+def model() -> traffic.NgramModel:
+    return traffic.NgramModel(CORPUS)
+
+
+def test_ngram_model_generates_text_of_the_requested_length(model) -> None:
+    """
+    GIVEN an n-gram model
+
+    THEN generated text has the requested length
+    AND only contains n-grams seen in the corpus
+    """
+    corpus = "".join(char for char in CORPUS if char.isalpha())
+    text = model.generate(random.Random(0), 200)
+
+    assert len(text) == 200
+    assert all(text[idx : idx + 3] in corpus for idx in range(len(text) - 2))
+
+
+def test_ngram_model_rejects_a_short_corpus() -> None:
+    with pytest.raises(ValueError):
+        traffic.NgramModel("AB", order=3)
+
+
+@pytest.mark.parametrize("plugboard_pairs", [0, 6, 13])
+def test_random_key_is_valid(plugboard_pairs) -> None:
+    """
+    GIVEN a number of plugboard pairs
+
+    THEN a key with distinct rotors and that many distinct pairs is created
+    """
+    key = traffic.random_key(random.Random(1), plugboard_pairs)
+
+    assert len(set(key.rotors)) == 3
+    assert all(0 <= setting < 26 for setting in [*key.indicators, *key.rings])
+    pairs = key.plugboard.split()
+    assert len(pairs) == plugboard_pairs
+    assert len(set("".join(pairs))) == 2 * plugboard_pairs
+
+
+def test_random_key_rejects_too_many_plugboard_pairs() -> None:
+    with pytest.raises(ValueError):
+        traffic.random_key(random.Random(1), 14)
+
+
+def test_generate_traffic_is_deterministic(model) -> None:
+    """
+    GIVEN the same seed
+
+    THEN the same traffic is generated
+    """
+    first = list(itertools.islice(traffic.generate_traffic(model, seed=7), 5))
+    second = list(itertools.islice(traffic.generate_traffic(model, seed=7), 5))
+    other = list(itertools.islice(traffic.generate_traffic(model, seed=8), 5))
+
+    assert first == second
+    assert first != other
+
+
+def test_generate_traffic_ciphertext_decrypts_to_plaintext(model) -> None:
+    messages = traffic.generate_traffic(model, seed=3, message_length=50)
+    for message in itertools.islice(messages, 5):
+        assert len(message.ciphertext) == 50
+        machine = EnigmaMachine.from_key(message.key)
+        assert machine.encrypt(message.ciphertext) == message.plaintext
+
+
+def test_write_traffic_writes_one_line_per_message() -> None:
+    """
+    GIVEN some messages
+
+    THEN each is written as a tab separated line
+    """
+    key = core.EnigmaKey(
+        rotors=[core.NamedRotor.IV, core.NamedRotor.II, core.NamedRotor.V],
+        indicators=[0, 1, 2],
+        rings=[25, 0, 3],
+        plugboard="AB CD",
+    )
+    message = traffic.TrafficMessage(key, "HELLO", "XYZZY")
+    stream = io.StringIO()
+
+    traffic.write_traffic([message, message], stream)
+
+    expected = "IV II V\tABC\tZAD\tAB CD\tHELLO\tXYZZY\n"
+    assert stream.getvalue() == expected * 2
+
+
+def test_ngram_model_rejects_an_order_below_one() -> None:
+    with pytest.raises(ValueError):
+        traffic.NgramModel(CORPUS, order=0)